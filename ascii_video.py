@@ -11,11 +11,18 @@ import cv2
 import numpy as np
 import sys
 import os
+import shutil
+import subprocess
 import argparse
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 # Character limit per .src file in GreyHack
 MAX_CHARS_PER_FILE = 160000
 
+# Frames quantized together in one vectorized step
+FRAMES_PER_BATCH = 32
+
 # ASCII characters from light to dark (so dark background = whitespace)
 ASCII_CHARS_DETAILED = " .:-=+*#%@"
 ASCII_CHARS_SIMPLE = " .,;:+*?%$#@"
@@ -28,40 +35,217 @@ ASCII_CHARS_SHADING = " ·˙‥…⁘⁙░▒▓█▪▫▬▭▮▯"
 ASCII_CHARS_DENSE = " .'`^,:;~-_+<>i!lI?|()1{}[]rcvunxzjftLCJUYXZO0QoahkbdpqwmMW*#%&@$▓█"
 
 
-def resize_frame(frame, new_width):
-    """Resize frame while maintaining aspect ratio adjusted for terminal characters."""
-    height, width = frame.shape[:2]
+def scaled_height(width, height, new_width):
+    """Output height for new_width, adjusted for terminal character aspect ratio."""
     # Characters are typically ~2x taller than wide, so we adjust
     aspect_ratio = height / width
-    new_height = int(new_width * aspect_ratio * 0.55)
-    return cv2.resize(frame, (new_width, new_height))
+    return int(new_width * aspect_ratio * 0.55)
+
 
+# Lookup tables for a character set, built once in main and shared by every
+# encoder. level_chars holds the character for each of the 256 gray levels
+# (integer equivalent of gray / 256 * num_chars), so quantizing is folded
+# into the lookup.
+AsciiLUT = namedtuple("AsciiLUT", ["chars", "num_chars", "is_ascii", "level_chars"])
 
-def frame_to_ascii(frame, ascii_chars=ASCII_CHARS_DETAILED):
-    """Convert a single frame to ASCII art."""
-    # Convert to grayscale if needed
-    if len(frame.shape) == 3:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+def build_ascii_lut(ascii_chars):
+    """Build the AsciiLUT for a character set."""
+    num_chars = len(ascii_chars)
+    is_ascii = ascii_chars.isascii()
+    levels = np.minimum((np.arange(256) * num_chars) >> 8, num_chars - 1)
+    
+    if is_ascii:
+        # Pure ASCII sets: one byte per character
+        lut = np.frombuffer(ascii_chars.encode("ascii"), dtype="S1")
     else:
-        gray = frame
+        lut = np.array(list(ascii_chars), dtype="U1")
     
-    # Normalize pixel values to ASCII character indices
-    num_chars = len(ascii_chars)
-    ascii_indices = (gray / 256 * num_chars).astype(int)
-    ascii_indices = np.clip(ascii_indices, 0, num_chars - 1)
+    return AsciiLUT(ascii_chars, num_chars, is_ascii, lut[levels])
+
+
+class AsciiEncoder:
+    """
+    Converts batches of grayscale frames of a fixed size to ASCII art.
+    The output buffer is allocated once for up to batch_size frames and reused,
+    so a whole batch is converted with a single table lookup and only the
+    returned strings are allocated.
+    """
     
-    # Convert to ASCII string
-    ascii_frame = "\n".join(
-        "".join(ascii_chars[pixel] for pixel in row)
-        for row in ascii_indices
-    )
+    def __init__(self, lut, width, height, batch_size=FRAMES_PER_BATCH):
+        self.width = width
+        self.height = height
+        self.is_ascii = lut.is_ascii
+        self.level_chars = lut.level_chars
+        
+        if self.is_ascii:
+            # Fixed newline column so a whole batch decodes in a single pass
+            self.chars = np.empty((batch_size, height, width + 1), dtype="S1")
+            self.chars[:, :, width] = b"\n"
+            # The same table and buffer as raw bytes, one pixel row per row,
+            # so cv2.LUT can fill the character columns in place
+            self.level_codes = self.level_chars.view(np.uint8)
+            self.codes = self.chars.view(np.uint8).reshape(batch_size * height, width + 1)
+        else:
+            self.chars = np.empty((batch_size, height, width), dtype="U1")
+    
+    def encode_batch(self, stack):
+        """Convert a (frames, height, width) uint8 stack to a list of ASCII frames."""
+        num_frames = len(stack)
+        
+        # Map every pixel straight to its character through the gray level table
+        chars = self.chars[:num_frames]
+        if self.is_ascii:
+            rows = stack.reshape(num_frames * self.height, self.width)
+            cv2.LUT(rows, self.level_codes, dst=self.codes[:len(rows), :self.width])
+            text = chars.tobytes().decode("ascii")
+            frame_size = self.height * (self.width + 1)
+            return [text[i:i + frame_size - 1] for i in range(0, len(text), frame_size)]
+        
+        # Unicode sets: view each row as one fixed-width string and join them.
+        # This beats both a newline column decoded as UTF-32 and str.translate
+        np.take(self.level_chars, stack, out=chars, mode="clip")
+        rows = chars.view(f"U{self.width}").reshape(num_frames, self.height)
+        return ["\n".join(frame_rows) for frame_rows in rows.tolist()]
+
+
+def read_opencv_frames(cap, width, height, skip=1):
+    """Yield (frame_number, resized_grayscale_frame) for kept frames using OpenCV."""
+    frame_count = 0
     
-    return ascii_frame
+    while True:
+        frame_count += 1
+        
+        # Skip frames based on skip parameter, advancing the stream without
+        # converting frames that would be thrown away
+        if frame_count % skip != 0:
+            if not cap.grab():
+                break
+            continue
+        
+        ret, frame = cap.read()
+        if not ret:
+            break
+        
+        # Resize first so the color conversion only touches the small frame
+        resized = cv2.resize(frame, (width, height))
+        yield frame_count, cv2.cvtColor(resized, cv2.COLOR_BGR2GRAY)
+    
+    cap.release()
+
+
+def read_ffmpeg_frames(video_path, width, height, skip=1, hwaccel=False):
+    """
+    Yield (frame_number, grayscale_frame) for kept frames using an ffmpeg pipe.
+    ffmpeg scales and outputs the luma plane directly, so only width x height
+    bytes per frame ever reach Python. The yielded array is reused for the
+    next frame. With hwaccel, ffmpeg picks a hardware decoder when one is
+    available and falls back to software otherwise.
+    """
+    # Drop skipped frames inside ffmpeg, before scaling and pixel format conversion
+    filters = [f"scale={width}:{height}:flags=area"]
+    if skip > 1:
+        filters.insert(0, f"select=not(mod(n+1\\,{skip}))")
+    command = ["ffmpeg", "-loglevel", "error", "-nostdin"]
+    if hwaccel:
+        command += ["-hwaccel", "auto"]
+    command += [
+        "-i", video_path,
+        "-vf", ",".join(filters), "-vsync", "passthrough",
+        "-pix_fmt", "gray", "-f", "rawvideo", "-",
+    ]
+    
+    frame = np.empty((height, width), dtype=np.uint8)
+    buffer = memoryview(frame).cast("B")
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE)
+    frame_count = 0
+    
+    try:
+        while proc.stdout.readinto(buffer) == len(buffer):
+            frame_count += skip
+            yield frame_count, frame
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    
+    if proc.returncode != 0:
+        raise ValueError(f"ffmpeg could not decode video file: {video_path}")
+
+
+def batch_frames(gray_frames, width, height, batch_size=FRAMES_PER_BATCH):
+    """
+    Group (frame_number, grayscale_frame) pairs into a (batch_size, height, width)
+    uint8 stack. Yields (frame_numbers, stack); the stack is reused for the next
+    batch, and the last one may hold fewer frames.
+    """
+    stack = np.empty((batch_size, height, width), dtype=np.uint8)
+    numbers = []
+    
+    for frame_count, gray in gray_frames:
+        stack[len(numbers)] = gray
+        numbers.append(frame_count)
+        if len(numbers) == batch_size:
+            yield numbers, stack
+            numbers = []
+    
+    if numbers:
+        yield numbers, stack[:len(numbers)]
+
+
+# Encoder owned by each worker process of convert_frames_parallel
+_worker_encoder = None
+
+
+def _init_worker(lut, width, height):
+    """Build the per-process encoder for convert_frames_parallel."""
+    global _worker_encoder
+    _worker_encoder = AsciiEncoder(lut, width, height)
+
+
+def _encode_in_worker(stack):
+    """Convert one batch of frames with the worker's encoder."""
+    return _worker_encoder.encode_batch(stack)
+
+
+def convert_frames_parallel(frame_batches, lut, width, height, jobs):
+    """
+    Convert (frame_numbers, stack) batches to ASCII across worker processes.
+    At most two batches per worker are in flight, so decoding carries on while
+    the workers convert. Yields (frame_number, ascii_frame) in order.
+    """
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(lut, width, height)) as executor:
+        pending = deque()
+        
+        for numbers, stack in frame_batches:
+            # Copy, since batch_frames reuses its stack
+            pending.append((numbers, executor.submit(_encode_in_worker, stack.copy())))
+            if len(pending) > 2 * jobs:
+                numbers, future = pending.popleft()
+                yield from zip(numbers, future.result())
+        
+        while pending:
+            numbers, future = pending.popleft()
+            yield from zip(numbers, future.result())
+
 
+def print_progress(frame_count, total_frames, kept):
+    """Overwrite the current console line with frame processing progress."""
+    progress = frame_count / total_frames * 100 if total_frames else 0
+    print(f"\rProcessing frames: {progress:.1f}% ({kept} kept)", end="", flush=True)
 
-def process_video(video_path, width, ascii_chars, skip=1):
-    """Process all frames of the video into ASCII art."""
-    cap = cv2.VideoCapture(video_path)
+
+def process_video(video_path, width, lut, skip=1, jobs=1, hwaccel=False):
+    """
+    Process all frames of the video into ASCII art.
+    This is a generator: each ASCII frame is yielded as soon as it is converted,
+    so the whole video never has to be held in memory.
+    """
+    # Use the FFmpeg backend, asking it for hardware decoding if requested
+    params = []
+    if hwaccel:
+        params = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+    cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, params)
     
     if not cap.isOpened():
         raise ValueError(f"Could not open video file: {video_path}")
@@ -72,142 +256,200 @@ def process_video(video_path, width, ascii_chars, skip=1):
     print(f"Processing video: {total_frames} frames at {fps:.2f} FPS")
     print(f"Output width: {width} characters")
     print(f"Frame skip: every {skip} frame(s) (keeping ~{total_frames // skip} frames)")
+    print(f"Worker processes: {jobs}")
     print()
     
-    frames = []
+    # Every frame is resized to the same shape, so it is computed once up front
+    source_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    source_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    height = scaled_height(source_width, source_height, width)
+    
+    # Prefer decoding straight to grayscale with ffmpeg when it is installed
+    if shutil.which("ffmpeg"):
+        cap.release()
+        gray_frames = read_ffmpeg_frames(video_path, width, height, skip, hwaccel)
+    else:
+        gray_frames = read_opencv_frames(cap, width, height, skip)
+    
+    # Convert to ASCII a batch of frames at a time
+    frame_batches = batch_frames(gray_frames, width, height)
+    if jobs > 1:
+        ascii_frames = convert_frames_parallel(frame_batches, lut, width, height, jobs)
+    else:
+        encoder = AsciiEncoder(lut, width, height)
+        ascii_frames = (
+            converted
+            for numbers, stack in frame_batches
+            for converted in zip(numbers, encoder.encode_batch(stack))
+        )
+    
+    kept = 0
     frame_count = 0
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
+    for frame_count, ascii_frame in ascii_frames:
+        yield ascii_frame
+        kept += 1
         
-        frame_count += 1
-        
-        # Skip frames based on skip parameter
-        if frame_count % skip != 0:
-            continue
-        
-        # Resize and convert to ASCII
-        resized = resize_frame(frame, width)
-        ascii_frame = frame_to_ascii(resized, ascii_chars)
-        frames.append(ascii_frame)
-        
-        # Progress indicator
-        progress = frame_count / total_frames * 100
-        print(f"\rProcessing frames: {progress:.1f}% ({len(frames)} kept)", end="", flush=True)
+        # Progress indicator, refreshed every 32 kept frames
+        if kept % 32 == 0:
+            print_progress(frame_count, total_frames, kept)
     
-    cap.release()
+    print_progress(frame_count, total_frames, kept)
     print("\nFrame processing complete!")
-    
-    return frames, fps
 
 
-def frame_to_variable(frame_index, frame_content):
-    """Convert a frame to a MiniScript variable assignment."""
-    # Escape quotes by doubling them (MiniScript syntax)
-    escaped = frame_content.replace('"', '""')
-    return f'f{frame_index} = "{escaped}"\n'
+def frame_to_variable(frame_index, frame_content, escape_quotes=True):
+    """
+    Convert a frame to a MiniScript variable assignment.
+    Pass escape_quotes=False when the character set has no '"', to skip
+    scanning the frame at all.
+    """
+    # Escape quotes by doubling them (MiniScript syntax). The membership test is
+    # a plain memchr scan, much cheaper than replace() on a frame with no quotes
+    if escape_quotes and '"' in frame_content:
+        frame_content = frame_content.replace('"', '""')
+    return f'f{frame_index} = "{frame_content}"\n'
 
 
-def split_frames_into_files(frames):
+def write_script_file(path, parts):
     """
-    Split frames into groups that fit within the character limit.
-    Returns a list of lists, where each inner list contains (frame_index, frame_content) tuples.
+    Write a script's text parts to path as UTF-8, encoded in one go and
+    written straight to the file descriptor, bypassing Python's file objects.
     """
-    files = []
+    data = memoryview("".join(parts).encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def write_data_file(output_folder, file_index, parts):
+    """Write one data file's variable assignments with a single write call."""
+    data_filename = f"data{file_index}.src"
+    os.makedirs(output_folder, exist_ok=True)
+    write_script_file(os.path.join(output_folder, data_filename), parts)
+    
+    return data_filename
+
+
+def write_data_files(frames, output_folder, escape_quotes=True):
+    """
+    Write frames to data files as they arrive, starting a new file whenever
+    the next frame would push the current one over the character limit.
+    Each file's assignments are buffered (at most MAX_CHARS_PER_FILE chars)
+    and written in one go. A frame identical to the one before it gets no new
+    variable; the previous variable is played again instead.
+    Returns (data_files, frame_variables): a list of
+    (data_filename, variable_count, char_count) tuples, and the variable index
+    to play for each frame in order.
+    """
+    data_files = []
+    frame_variables = []
     current_file = []
     current_chars = 0
+    num_variables = 0
+    previous_frame = None
     
-    for i, frame in enumerate(frames):
-        var_str = frame_to_variable(i, frame)
+    for frame in frames:
+        # Repeat the last variable for frames identical to the previous one
+        if frame == previous_frame:
+            frame_variables.append(num_variables - 1)
+            continue
+        previous_frame = frame
+        
+        var_str = frame_to_variable(num_variables, frame, escape_quotes)
         var_len = len(var_str)
+        frame_variables.append(num_variables)
+        num_variables += 1
         
         # Check if adding this frame would exceed the limit
         if current_chars + var_len > MAX_CHARS_PER_FILE and current_file:
             # Save current file and start a new one
-            files.append(current_file)
+            data_filename = write_data_file(output_folder, len(data_files), current_file)
+            data_files.append((data_filename, len(current_file), current_chars))
             current_file = []
             current_chars = 0
         
-        current_file.append((i, frame))
+        current_file.append(var_str)
         current_chars += var_len
     
     # Don't forget the last file
     if current_file:
-        files.append(current_file)
+        data_filename = write_data_file(output_folder, len(data_files), current_file)
+        data_files.append((data_filename, len(current_file), current_chars))
     
-    return files
+    return data_files, frame_variables
 
 
-def generate_greyhack_scripts(frames, output_folder, video_name, wait_time=0.1, greyhack_path="/home/user"):
-    """Generate GreyHack .src script files, splitting if necessary."""
-    print(f"\nGenerating GreyHack scripts...")
+def generate_greyhack_scripts(frames, output_folder, video_name, wait_time=0.1, greyhack_path="/home/user",
+                              ascii_chars=None):
+    """
+    Generate GreyHack .src script files, splitting if necessary.
+    frames can be any iterable, such as the process_video generator; frames are
+    streamed to disk rather than collected first. If ascii_chars is given and
+    has no '"', frames are not scanned for quotes to escape.
+    Returns (data_filenames, total_chars, frame_count); nothing is written if
+    there are no frames.
+    """
+    # Generate data files
+    needs_escape = ascii_chars is None or '"' in ascii_chars
+    data_files, frame_variables = write_data_files(frames, output_folder, needs_escape)
+    num_files = len(data_files)
+    num_frames = len(frame_variables)
+    num_unique = sum(variable_count for _, variable_count, _ in data_files)
+    total_chars = sum(char_count for _, _, char_count in data_files)
+    
+    if not num_frames:
+        return [], 0, 0
+    
+    print(f"\nGenerated {num_files} GreyHack data file(s):")
+    for data_filename, variable_count, char_count in data_files:
+        print(f"  {data_filename}: {variable_count} frames, {char_count:,} chars")
+    if num_unique < num_frames:
+        print(f"  {num_frames - num_unique} repeated frame(s) reuse the previous frame")
     
-    # Create output folder
-    os.makedirs(output_folder, exist_ok=True)
+    # Generate main script that imports and plays
+    main_path = os.path.join(output_folder, f"{video_name}.src")
     
-    # Split frames into files
-    file_groups = split_frames_into_files(frames)
-    num_files = len(file_groups)
+    # Import all data files
+    parts = [
+        f"// ASCII Video Player - {video_name}\n",
+        f"// Generated with {num_frames} frames across {num_files} data file(s)\n",
+        f"// IMPORTANT: Update the path below to match your GreyHack location!\n\n",
+    ]
     
-    print(f"Splitting into {num_files} data file(s)...")
+    for data_file, _, _ in data_files:
+        parts.append(f'import_code("{greyhack_path}/{video_name}/{data_file}")\n')
     
-    # Generate data files
-    data_files = []
-    total_chars = 0
+    parts.append("\n")
     
-    for file_idx, frame_group in enumerate(file_groups):
-        data_filename = f"data{file_idx}.src"
-        data_path = os.path.join(output_folder, data_filename)
-        data_files.append(data_filename)
-        
-        with open(data_path, 'w', encoding='utf-8') as f:
-            file_chars = 0
-            for frame_idx, frame_content in frame_group:
-                var_str = frame_to_variable(frame_idx, frame_content)
-                f.write(var_str)
-                file_chars += len(var_str)
-            
-            total_chars += file_chars
-            print(f"  {data_filename}: {len(frame_group)} frames, {file_chars:,} chars")
+    # Build the frames list
+    parts.append("// Build frames list\n")
+    parts.append("frames = []\n")
+    parts.extend([f"frames.push(f{i})\n" for i in frame_variables])
     
-    # Generate main script that imports and plays
-    main_path = os.path.join(output_folder, f"{video_name}.src")
+    parts.append("\n")
     
-    with open(main_path, 'w', encoding='utf-8') as f:
-        # Import all data files
-        f.write(f"// ASCII Video Player - {video_name}\n")
-        f.write(f"// Generated with {len(frames)} frames across {num_files} data file(s)\n")
-        f.write(f"// IMPORTANT: Update the path below to match your GreyHack location!\n\n")
-        
-        for data_file in data_files:
-            f.write(f'import_code("{greyhack_path}/{video_name}/{data_file}")\n')
-        
-        f.write("\n")
-        
-        # Build the frames list
-        f.write("// Build frames list\n")
-        f.write("frames = []\n")
-        for i in range(len(frames)):
-            f.write(f"frames.push(f{i})\n")
-        
-        f.write("\n")
-        
-        # Play loop
-        f.write("// Play animation\n")
-        f.write("while true\n")
-        f.write("  for frame in frames\n")
-        f.write("    print(frame)\n")
-        f.write(f"    wait({wait_time})\n")
-        # f.write("    clear_screen\n") # This bugs it all out, isn't needed 
-        f.write("  end for\n")
-        f.write("end while\n")
+    # Play loop
+    parts.append("// Play animation\n")
+    parts.append("while true\n")
+    parts.append("  for frame in frames\n")
+    parts.append("    print(frame)\n")
+    parts.append(f"    wait({wait_time})\n")
+    # parts.append("    clear_screen\n") # This bugs it all out, isn't needed 
+    parts.append("  end for\n")
+    parts.append("end while\n")
+    
+    write_script_file(main_path, parts)
     
     main_chars = os.path.getsize(main_path)
     print(f"  {video_name}.src: main player, {main_chars:,} chars")
     
-    return data_files, total_chars
+    return [data_file for data_file, _, _ in data_files], total_chars, num_frames
 
 
 def main():
@@ -223,6 +465,8 @@ Examples:
   python ascii_video.py video.mp4 --style extended            # max detail unicode
   python ascii_video.py video.mp4 -w 60 -k 5 -t 0.2 -o myvideo
   python ascii_video.py video.mp4 --path /home/me/Videos      # set GreyHack import path
+  python ascii_video.py video.mp4 --width 200 --jobs 4        # convert on 4 processes
+  python ascii_video.py video.mp4 --hwaccel                   # decode on the GPU if possible
 
 Styles (by detail level):
   simple    - 11 basic ASCII chars
@@ -256,6 +500,10 @@ Output Structure:
     parser.add_argument("--style", "-s", 
                         choices=["detailed", "simple", "blocks", "unicode", "extended", "shading", "dense"],
                         default="unicode", help="Character style (default: unicode)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for ASCII conversion (default: 1, no pool)")
+    parser.add_argument("--hwaccel", action="store_true",
+                        help="Use hardware video decoding when available")
     
     args = parser.parse_args()
     
@@ -279,6 +527,7 @@ Output Structure:
         "dense": ASCII_CHARS_DENSE
     }
     ascii_chars = ascii_styles[args.style]
+    lut = build_ascii_lut(ascii_chars)
     
     print("=" * 50)
     print("  ASCII Video to GreyHack Script Converter")
@@ -288,30 +537,30 @@ Output Structure:
     print(f"Width: {args.width} characters")
     print(f"Frame skip: {args.skip}")
     print(f"Wait time: {args.wait}s")
-    print(f"Style: {args.style} ({len(ascii_chars)} characters)")
+    print(f"Style: {args.style} ({lut.num_chars} characters)")
     print(f"GreyHack path: {args.path}/{output_folder}/")
     print(f"Max chars/file: {MAX_CHARS_PER_FILE:,}")
     print("=" * 50)
     print()
     
-    # Process video
-    frames, fps = process_video(args.video, args.width, ascii_chars, args.skip)
+    # Process video and stream the frames into the GreyHack scripts
+    frames = process_video(
+        args.video, args.width, lut, args.skip, args.jobs, args.hwaccel
+    )
+    data_files, total_chars, num_frames = generate_greyhack_scripts(
+        frames, output_folder, base_name, args.wait, args.path, lut.chars
+    )
     
-    if not frames:
+    if not num_frames:
         print("Error: No frames could be extracted from the video.")
         sys.exit(1)
     
-    # Generate the GreyHack scripts
-    data_files, total_chars = generate_greyhack_scripts(
-        frames, output_folder, base_name, args.wait, args.path
-    )
-    
     # Summary
     print()
     print("=" * 50)
     print("  Done!")
     print("=" * 50)
-    print(f"Frames: {len(frames)}")
+    print(f"Frames: {num_frames}")
     print(f"Output folder: {output_folder}/")
     print(f"Data files: {len(data_files)}")
     print(f"Total size: {total_chars / (1024*1024):.2f} MB ({total_chars:,} chars)")